@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared RAW RGBA I/O helpers for the frame analyzer scripts
+(analyze_raw.py, simple_analyze.py, check_frame.py)
+"""
+
+import mmap
+
+try:
+    import numpy as np
+    _HAS_NP = True
+except ImportError:
+    _HAS_NP = False
+
+# Resolutions the emulator actually dumps: native NES output and the
+# 3x-scaled SDL2 window (256*3 x 240*3)
+_KNOWN_RESOLUTIONS = {
+    768 * 720: ((768, 720), "scaled"),
+    256 * 240: ((256, 240), "original"),
+}
+
+def map_bytes(path):
+    """Memory-map a file read-only, so slices read straight from the
+    page cache instead of copying the whole file into a bytes object"""
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def detect_resolution(path, size_bytes, default=(256, 240)):
+    """Print the size check for a RAW RGBA dump and return (width, height)"""
+    width, height = default
+
+    print(f"File: {path}")
+    print(f"Size: {size_bytes} bytes")
+
+    expected_size = width * height * 4
+    if size_bytes == expected_size:
+        print(f"✓ Size matches {width}x{height} RGBA")
+    else:
+        total_pixels = size_bytes // 4
+        print(f"⚠ Size mismatch. Expected {expected_size}, got {size_bytes}")
+        print(f"Total pixels: {total_pixels}")
+
+        if total_pixels in _KNOWN_RESOLUTIONS:
+            (width, height), kind = _KNOWN_RESOLUTIONS[total_pixels]
+            print(f"Detected resolution: {width}x{height} ({kind})")
+
+    return width, height
+
+def load_rgba(path, default=(256, 240)):
+    """Memory-map a RAW RGBA file and return (packed_u32, (width, height)).
+
+    packed_u32 views every RGBA pixel as one little-endian uint32
+    (R in the low byte, A in the high byte), truncated to width*height
+    pixels. Requires NumPy.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    width, height = detect_resolution(path, len(data), default)
+    n = min(len(data) // 4, width * height)
+    packed = data[:n * 4].view(np.uint32)
+    return packed, (width, height)
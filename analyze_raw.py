@@ -3,64 +3,49 @@
 RAW RGBA files analyzer for debugging SDL2 color issues
 """
 
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
 import numpy as np
 from PIL import Image
 
+from _rgba_io import load_rgba
+
 def analyze_raw_rgba(filename, width=256, height=240):
     """Analyze RAW RGBA file and convert to PNG"""
     try:
-        # Read raw RGBA data
-        with open(filename, 'rb') as f:
-            data = f.read()
-        
-        print(f"File: {filename}")
-        print(f"Size: {len(data)} bytes")
-        
-        # Expected size check
-        expected_size = width * height * 4
-        if len(data) == expected_size:
-            print(f"✓ Size matches {width}x{height} RGBA")
-        else:
-            # Try to detect actual dimensions
-            total_pixels = len(data) // 4
-            print(f"⚠ Size mismatch. Expected {expected_size}, got {len(data)}")
-            print(f"Total pixels: {total_pixels}")
-            
-            # Common resolutions
-            if total_pixels == 768 * 720:  # 768x720 (256*3 x 240*3)
-                width, height = 768, 720
-                print(f"Detected resolution: {width}x{height} (scaled)")
-            elif total_pixels == 256 * 240:
-                width, height = 256, 240
-                print(f"Detected resolution: {width}x{height} (original)")
-        
-        # Reshape data
-        pixels = np.frombuffer(data, dtype=np.uint8)
-        if len(pixels) % 4 != 0:
-            print("❌ Invalid RGBA data length")
-            return
-            
-        pixels = pixels.reshape((-1, 4))[:width*height]  # Take only what we need
-        pixels = pixels.reshape((height, width, 4))
-        
+        # Map the file and get every RGBA pixel as one packed uint32, so
+        # each analysis below is a single 4-byte load per pixel
+        packed, (width, height) = load_rgba(filename, (width, height))
+
         # Analyze first few pixels
         print("\nFirst 8 pixels (RGBA):")
-        for i in range(min(8, width)):
-            r, g, b, a = pixels[0, i]
+        first = packed[:min(8, width)].copy().view(np.uint8).reshape(-1, 4)
+        for i, (r, g, b, a) in enumerate(first):
             print(f"  Pixel {i}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X})")
-        
-        # Analyze color distribution
-        unique_colors = np.unique(pixels.reshape(-1, 4), axis=0)
-        print(f"\nUnique colors: {len(unique_colors)}")
-        for i, (r, g, b, a) in enumerate(unique_colors[:10]):  # Show first 10
-            count = np.sum(np.all(pixels.reshape(-1, 4) == [r, g, b, a], axis=1))
+
+        # Analyze color distribution (one pass over the packed pixels)
+        keys, counts = np.unique(packed, return_counts=True)
+        print(f"\nUnique colors: {len(keys)}")
+        # Top 10 via argpartition: O(U) select, then sort only the winners
+        k = min(10, counts.size)
+        order = np.argpartition(-counts, k - 1)[:k]
+        order = order[np.argsort(-counts[order])]
+        top_colors = keys[order].copy().view(np.uint8).reshape(-1, 4)
+        for i, ((r, g, b, a), count) in enumerate(zip(top_colors, counts[order])):
             print(f"  Color {i+1}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X}) - {count} pixels")
         
-        # Convert to PIL Image and save as PNG
-        img = Image.fromarray(pixels[:, :, :3], 'RGB')  # Drop alpha for PNG
+        # Convert to PIL Image and save as PNG (RGBA as-is: PNG supports
+        # alpha, and frombuffer avoids the strided copy a [:, :, :3]
+        # slice would force); unpack to (H, W, 4) uint8 only here
+        pixels = packed.view(np.uint8).reshape((height, width, 4))
+        img = Image.frombuffer('RGBA', (width, height), pixels, 'raw', 'RGBA', 0, 1)
         png_filename = filename.replace('.raw', '.png')
-        img.save(png_filename)
+        # Debug dumps favor wall time over file size: minimal deflate
+        # effort roughly triples encode throughput vs the default level 6
+        img.save(png_filename, compress_level=1)
         print(f"\n✓ Converted to PNG: {png_filename}")
         
         return True
@@ -69,16 +54,34 @@ def analyze_raw_rgba(filename, width=256, height=240):
         print(f"❌ Error analyzing {filename}: {e}")
         return False
 
+def _analyze_to_string(filename):
+    """Worker wrapper: run the analysis with stdout captured so the
+    parent can print per-file reports in order"""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        analyze_raw_rgba(filename)
+    return out.getvalue()
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python3 analyze_raw.py <raw_file1> [raw_file2] ...")
         print("Example: python3 analyze_raw.py test_pattern.raw nes_frame.raw")
         return
-    
-    for filename in sys.argv[1:]:
+
+    files = sys.argv[1:]
+    if len(files) == 1:
         print("=" * 60)
-        analyze_raw_rgba(filename)
+        analyze_raw_rgba(files[0])
         print()
+        return
+
+    # Each dumped frame is independent, so batch runs fan out across
+    # cores; reports are printed here to keep output ordered
+    with ProcessPoolExecutor() as ex:
+        for report in ex.map(_analyze_to_string, files):
+            print("=" * 60)
+            print(report, end='')
+            print()
 
 if __name__ == "__main__":
     main()
@@ -1,30 +1,65 @@
 #!/usr/bin/env python3
+import os
 import sys
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+from struct import iter_unpack
+
+try:
+    import numpy as np
+    _HAS_NP = True
+except ImportError:
+    _HAS_NP = False
+
+from _rgba_io import map_bytes
+
+_CHUNK_PIXELS = 65536  # 256 KiB reads keep the working set in L2
+
+def _count_pixels_np(filename):
+    """NumPy fast path: stream packed uint32 pixels in fixed chunks so
+    peak memory stays flat no matter how large the dump is"""
+    size = os.path.getsize(filename)
+    counter = Counter()
+    non_zero = 0
+    with open(filename, 'rb') as f:
+        while True:
+            arr = np.fromfile(f, dtype=np.uint32, count=_CHUNK_PIXELS)
+            if arr.size == 0:
+                break
+            vals, counts = np.unique(arr, return_counts=True)
+            counter.update(dict(zip(vals.tolist(), counts.tolist())))
+            non_zero += int((arr != 0).sum())
+    return size, counter, non_zero
+
+def _count_pixels_pure(filename):
+    """Fallback without NumPy: Counter over struct.iter_unpack does the
+    per-pixel update loop in C instead of two dict probes per pixel,
+    and keying on the packed uint32 avoids a tuple allocation per pixel"""
+    data = map_bytes(filename)
+    view = memoryview(data)[:len(data) // 4 * 4]
+    pixel_counts = Counter(v for (v,) in iter_unpack('<I', view))
+    non_zero = sum(pixel_counts.values()) - pixel_counts.get(0, 0)
+    return len(data), pixel_counts, non_zero
 
 def analyze_frame(filename):
     """Analyze a raw framebuffer to look for text patterns"""
     try:
-        with open(filename, 'rb') as f:
-            data = f.read()
-        
-        print(f"Analyzing {filename} ({len(data)} bytes)")
-        
-        # Count different pixel values
-        pixel_counts = {}
-        for i in range(0, len(data), 4):  # Assuming RGBA format
-            if i + 3 < len(data):
-                pixel = data[i:i+4]
-                key = tuple(pixel)
-                pixel_counts[key] = pixel_counts.get(key, 0) + 1
-        
+        if _HAS_NP:
+            size, pixel_counts, non_zero_pixels = _count_pixels_np(filename)
+        else:
+            size, pixel_counts, non_zero_pixels = _count_pixels_pure(filename)
+
+        print(f"Analyzing {filename} ({size} bytes)")
+
         print(f"Found {len(pixel_counts)} unique pixel values:")
-        for pixel, count in sorted(pixel_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
-            print(f"  RGBA({pixel[0]:02X},{pixel[1]:02X},{pixel[2]:02X},{pixel[3]:02X}): {count} pixels")
-        
+        for pixel, count in nlargest(10, pixel_counts.items(), key=itemgetter(1)):
+            r, g, b, a = pixel.to_bytes(4, 'little')
+            print(f"  RGBA({r:02X},{g:02X},{b:02X},{a:02X}): {count} pixels")
+
         # Look for patterns that might indicate text
-        non_zero_pixels = sum(1 for i in range(0, len(data), 4) if any(data[i:i+4]))
-        print(f"Non-zero pixels: {non_zero_pixels} / {len(data)//4}")
-        
+        print(f"Non-zero pixels: {non_zero_pixels} / {size//4}")
+
     except Exception as e:
         print(f"Error analyzing {filename}: {e}")
 
@@ -32,4 +67,4 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         analyze_frame(sys.argv[1])
     else:
-        analyze_frame("debug_frame_600.raw")
\ No newline at end of file
+        analyze_frame("debug_frame_600.raw")
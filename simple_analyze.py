@@ -1,70 +1,122 @@
 #!/usr/bin/env python3
 """
 Simple RAW RGBA file analyzer without external dependencies
+(NumPy is used automatically when available)
 """
 
 import sys
 import struct
+from heapq import nlargest
+from operator import itemgetter
 
-def analyze_raw_rgba(filename, width=256, height=240):
+try:
+    import numpy as np
+    _HAS_NP = True
+except ImportError:
+    _HAS_NP = False
+
+from _rgba_io import detect_resolution, load_rgba, map_bytes
+
+# Test pattern colors (red, green, blue, white) as packed little-endian
+# uint32: A in the high byte, R in the low byte. Kept sorted for searchsorted.
+EXPECTED_COLORS = (0xFF0000FF, 0xFF00FF00, 0xFFFF0000, 0xFFFFFFFF)
+
+_CHUNK_PIXELS = 16384  # 64 KiB of pixels per early-exit scan chunk
+
+def _find_expected_colors(packed):
+    """Chunked early-exit scan for the test-pattern check: stop reading
+    as soon as every expected color has been seen, which on real test
+    patterns happens within the first few scanlines"""
+    expected = set(EXPECTED_COLORS)
+    found = set()
+    for start in range(0, packed.size, _CHUNK_PIXELS):
+        chunk = packed[start:start + _CHUNK_PIXELS]
+        found |= set(np.unique(chunk).tolist()) & expected
+        if len(found) == len(expected):
+            break
+    return found
+
+def _analyze_vectorized(u32):
+    """NumPy fast path: packed-uint32 view plus one np.unique aggregation"""
+    # Analyze first few pixels
+    print("\nFirst 8 pixels (RGBA):")
+    first = u32[:8].copy().view(np.uint8).reshape(-1, 4)
+    for i, (r, g, b, a) in enumerate(first):
+        print(f"  Pixel {i}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X})")
+
+    # Analyze color distribution (sample every 1000th pixel)
+    sampled = u32[::max(1, u32.size // 1000)]
+    keys, counts = np.unique(sampled, return_counts=True)
+
+    print(f"\nColor distribution (sampled):")
+    order = np.argsort(-counts)[:10]
+    top_colors = keys[order].copy().view(np.uint8).reshape(-1, 4)
+    for i, ((r, g, b, a), count) in enumerate(zip(top_colors, counts[order])):
+        print(f"  Color {i+1}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X}) - {count} samples")
+
+    return set(int(k) for k in keys)
+
+def _analyze_fast(packed):
+    """--fast: histogram only the 4 expected colors via searchsorted +
+    bincount, skipping the full unique-color table"""
+    palette = np.array(EXPECTED_COLORS, dtype=np.uint32)
+    idx = np.searchsorted(palette, packed)
+    matched = (idx < palette.size) & (palette[np.clip(idx, 0, palette.size - 1)] == packed)
+    counts = np.bincount(idx[matched], minlength=palette.size)
+
+    print("\nExpected color counts:")
+    for color, count in zip(EXPECTED_COLORS, counts):
+        r, g, b, a = color.to_bytes(4, 'little')
+        print(f"  R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X}) - {count} pixels")
+
+    return {color for color, count in zip(EXPECTED_COLORS, counts) if count}
+
+def _analyze_pure(data):
+    """Pure-Python fallback when NumPy is missing"""
+    # Analyze first few pixels
+    print("\nFirst 8 pixels (RGBA):")
+    for i in range(min(8, len(data) // 4)):
+        offset = i * 4
+        r, g, b, a = struct.unpack('BBBB', data[offset:offset+4])
+        print(f"  Pixel {i}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X})")
+
+    # Analyze color distribution (sample every 1000th pixel)
+    colors = {}
+    step = max(1, len(data) // (4 * 1000))  # Sample ~1000 pixels
+    for i in range(0, len(data) - 3, step * 4):
+        color, = struct.unpack('<I', data[i:i+4])
+        colors[color] = colors.get(color, 0) + 1
+
+    print(f"\nColor distribution (sampled):")
+    for i, (color, count) in enumerate(nlargest(10, colors.items(), key=itemgetter(1))):
+        r, g, b, a = color.to_bytes(4, 'little')
+        print(f"  Color {i+1}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X}) - {count} samples")
+
+    return set(colors.keys())
+
+def analyze_raw_rgba(filename, width=256, height=240, fast=False):
     """Analyze RAW RGBA file"""
     try:
-        # Read raw RGBA data
-        with open(filename, 'rb') as f:
-            data = f.read()
-        
-        print(f"File: {filename}")
-        print(f"Size: {len(data)} bytes")
-        
-        # Expected size check
-        expected_size = width * height * 4
-        if len(data) == expected_size:
-            print(f"✓ Size matches {width}x{height} RGBA")
+        if _HAS_NP:
+            # Shared memory-mapped prologue: size check plus packed-uint32 view
+            packed, (width, height) = load_rgba(filename, (width, height))
+            if fast:
+                found_colors = _analyze_fast(packed)
+            else:
+                _analyze_vectorized(packed)
+                # Decide the pattern verdict from a short-circuit scan of
+                # the full frame rather than the 1000-pixel sample
+                found_colors = _find_expected_colors(packed)
         else:
-            # Try to detect actual dimensions
-            total_pixels = len(data) // 4
-            print(f"⚠ Size mismatch. Expected {expected_size}, got {len(data)}")
-            print(f"Total pixels: {total_pixels}")
-            
-            # Common resolutions
-            if total_pixels == 768 * 720:  # 768x720 (256*3 x 240*3)
-                width, height = 768, 720
-                print(f"Detected resolution: {width}x{height} (scaled)")
-            elif total_pixels == 256 * 240:
-                width, height = 256, 240
-                print(f"Detected resolution: {width}x{height} (original)")
-        
-        # Analyze first few pixels
-        print("\nFirst 8 pixels (RGBA):")
-        for i in range(min(8, len(data) // 4)):
-            offset = i * 4
-            r, g, b, a = struct.unpack('BBBB', data[offset:offset+4])
-            print(f"  Pixel {i}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X})")
-        
-        # Analyze color distribution (sample every 1000th pixel)
-        colors = {}
-        step = max(1, len(data) // (4 * 1000))  # Sample ~1000 pixels
-        for i in range(0, len(data) - 3, step * 4):
-            r, g, b, a = struct.unpack('BBBB', data[i:i+4])
-            color = (r, g, b, a)
-            colors[color] = colors.get(color, 0) + 1
-        
-        print(f"\nColor distribution (sampled):")
-        sorted_colors = sorted(colors.items(), key=lambda x: x[1], reverse=True)
-        for i, ((r, g, b, a), count) in enumerate(sorted_colors[:10]):
-            print(f"  Color {i+1}: R={r:3d} G={g:3d} B={b:3d} A={a:3d} (#{r:02X}{g:02X}{b:02X}) - {count} samples")
-        
+            data = map_bytes(filename)
+            width, height = detect_resolution(filename, len(data), (width, height))
+            found_colors = _analyze_pure(data)
+
         # Check if this looks like test pattern (should have red, green, blue, white)
-        expected_colors = {
-            (255, 0, 0, 255),    # Red
-            (0, 255, 0, 255),    # Green  
-            (0, 0, 255, 255),    # Blue
-            (255, 255, 255, 255) # White
-        }
-        
-        found_colors = set(colors.keys())
+        expected_colors = set(EXPECTED_COLORS)
+
         matches = expected_colors.intersection(found_colors)
-        
+
         if len(matches) == 4:
             print(f"\n✓ Test pattern detected! Found all 4 expected colors")
         else:
@@ -72,24 +124,29 @@ def analyze_raw_rgba(filename, width=256, height=240):
             missing = expected_colors - found_colors
             if missing:
                 print("  Missing colors:")
-                for r, g, b, a in missing:
+                for c in missing:
+                    r, g, b, a = c.to_bytes(4, 'little')
                     print(f"    R={r:3d} G={g:3d} B={b:3d} A={a:3d}")
-        
+
         return True
-        
+
     except Exception as e:
         print(f"❌ Error analyzing {filename}: {e}")
         return False
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 simple_analyze.py <raw_file1> [raw_file2] ...")
+    args = sys.argv[1:]
+    fast = '--fast' in args
+    files = [a for a in args if a != '--fast']
+
+    if not files:
+        print("Usage: python3 simple_analyze.py [--fast] <raw_file1> [raw_file2] ...")
         return
-    
-    for filename in sys.argv[1:]:
+
+    for filename in files:
         print("=" * 60)
-        analyze_raw_rgba(filename)
+        analyze_raw_rgba(filename, fast=fast)
         print()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,16 +1,65 @@
 #!/usr/bin/env python3
 
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Log/antilog tables over the generator 3 (x + 1): every non-zero GF(2^8)
+# element is 3^k, so a*b = antilog[log[a] + log[b]]. The antilog table is
+# doubled so the summed index never needs a mod 255.
+_LOG = [0] * 256
+_ANTILOG = [0] * 512
+_g = 1
+for _i in range(255):
+    _ANTILOG[_i] = _g
+    _LOG[_g] = _i
+    _g ^= (_g << 1) ^ (0x11B if _g & 0x80 else 0)  # Rijndael polynomial
+    _g &= 0xFF
+for _i in range(255, 512):
+    _ANTILOG[_i] = _ANTILOG[_i - 255]
+del _g, _i
+
 def rijndael_gf_multiply(a, b):
-    """Rijndael Galois Field multiplication (GF(2^8))"""
-    result = 0
-    while b:
-        if b & 1:
-            result ^= a
-        a <<= 1
-        if a & 0x100:
-            a ^= 0x11B  # Rijndael polynomial
-        b >>= 1
-    return result & 0xFF
+    """Rijndael Galois Field multiplication (GF(2^8))
+
+    Log/antilog form: one add and two table loads replace the
+    8-iteration bit loop.
+    """
+    if a == 0 or b == 0:
+        return 0
+    return _ANTILOG[_LOG[a] + _LOG[b]]
+
+if _HAS_NUMBA:
+    # JIT-compile the multiplier so bulk pattern generation (e.g. a full
+    # CHR-RAM test pattern) doesn't pay per-call interpreter overhead;
+    # arrays instead of lists so the globals freeze cleanly under njit
+    _LOG = np.array(_LOG, np.int64)
+    _ANTILOG = np.array(_ANTILOG, np.int64)
+    rijndael_gf_multiply = njit(cache=True)(rijndael_gf_multiply)
+
+    @njit(cache=True)
+    def _fill_gf_table(table):
+        for a in range(256):
+            for b in range(256):
+                table[a, b] = rijndael_gf_multiply(a, b)
+
+_GF_TABLE = None
+
+def gf_mul_table():
+    """Full 256x256 GF(2^8) multiplication table; built once, then each
+    product is a single table lookup instead of a branchy bit loop"""
+    global _GF_TABLE
+    if _GF_TABLE is None:
+        if _HAS_NUMBA:
+            _GF_TABLE = np.empty((256, 256), np.uint8)
+            _fill_gf_table(_GF_TABLE)
+        else:
+            _GF_TABLE = [bytes(rijndael_gf_multiply(a, b) for b in range(256))
+                         for a in range(256)]
+    return _GF_TABLE
 
 def generate_test_pattern():
     """Generate the test pattern used by mmc3bigchrram.nes"""